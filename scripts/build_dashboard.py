@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from html import unescape
+from functools import lru_cache
+from html import escape, unescape
+from itertools import repeat
 from pathlib import Path
+import os
 import re
 
 
@@ -11,8 +16,106 @@ UPDATES_DIR = ROOT / "private" / "updates"
 TEMPLATE_PATH = ROOT / "private" / "dev" / "dashboard.template.html"
 OUTPUT_PATH = ROOT / "private" / "dev" / "dashboard.html"
 REPO_TEMPLATE_PATH = ROOT / "private" / "dev" / "repo.template.html"
+DASHBOARD_RAIL_ENTRY = "      <a class=\"server-dot\" href=\"dashboard.html\" title=\"Dashboard\">CD</a>"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SECTION_RE = re.compile(r"(<section[^>]*>.*?</section>)", re.S)
+_SECTION_ATTRS_RE = re.compile(r'<section[^>]*data-repo="([^"]+)"[^>]*data-agent="([^"]+)"')
+_ARTICLE_RE = re.compile(
+    r'<article[^>]*data-status="([^"]+)"[^>]*data-time="([^"]+)"[^>]*>(.*?)</article>',
+    re.S,
+)
+_BODY_RE = re.compile(r"<h4>(.*?)</h4>|<strong>(Stage|Notes):</strong>\s*([^<]+)", re.S)
+_ISO_DISPLAY_RE = re.compile(
+    r"([1-9]\d{3}-\d{2}-\d{2})[T ](\d{2}:\d{2})(?::\d{2}(?:\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?"
+)
+_INDENT_NONBLANK_RE = re.compile(r"^(?=[^\S\n]*\S)", re.M)
+_SLUG_SPLIT_RE = re.compile(r"[^A-Za-z0-9]+")
+_DASH_RE = re.compile(r"\{\{(STATUS_ROWS|HISTORY_BLOCKS|SERVER_RAIL)\}\}")
+_REPO_RE = re.compile(
+    r"\{\{("
+    r"SERVER_RAIL|REPO_NAME|AGENT_NAME|LATEST_STATUS_CLASS|LATEST_STATUS_LABEL|"
+    r"LATEST_SUMMARY|LATEST_STAGE|LATEST_TIME_DISPLAY|RECENT_OUTCOME_TITLE|"
+    r"RECENT_OUTCOME_NOTE|ACTIVITY_ITEMS|INCIDENT_ITEMS|METRIC_CARDS|"
+    r"EXPERIMENT_ITEMS|HISTORY_SECTION"
+    r")\}\}"
+)
+
+_RAIL_TMPL = "      <a class=\"server-dot\" href=\"{page_e}\" title=\"{repo_e}\">{badge}</a>"
+_ROW_TMPL = (
+    "            <tr>\n"
+    "              <td data-label=\"Repo\"><a class=\"repo-link\" href=\"{page_e}\">{repo_e}</a></td>\n"
+    "              <td data-label=\"Latest Status\"><span class=\"status-pill {status}\">{status_label}</span></td>\n"
+    "              <td data-label=\"Last Update\">{time_display}</td>\n"
+    "              <td data-label=\"Agent\">{agent_e}</td>\n"
+    "              <td data-label=\"Summary\">{summary_e}</td>\n"
+    "            </tr>"
+)
+_HISTORY_TMPL = (
+    "          <div class=\"repo-block\">\n"
+    "            <div class=\"repo-header\">\n"
+    "              <h3>{repo}</h3>\n"
+    "              <span>Agent: {agent}</span>\n"
+    "            </div>\n"
+    "{section}\n"
+    "          </div>"
+)
+_ACTIVITY_TMPL = (
+    "          <li class=\"activity-item\">\n"
+    "            <div>\n"
+    "              <strong>{summary}</strong>\n"
+    "              <div class=\"item-meta\">Stage: {stage}</div>\n"
+    "            </div>\n"
+    "            <div class=\"item-meta\">{time}</div>\n"
+    "          </li>"
+)
+_INCIDENT_TMPL = (
+    "          <li class=\"incident-item\">\n"
+    "            <div>\n"
+    "              <strong>{summary}</strong>\n"
+    "              <div class=\"item-meta\">{notes}</div>\n"
+    "            </div>\n"
+    "            <div class=\"item-meta\">{time}</div>\n"
+    "          </li>"
+)
+_METRIC_TMPL = (
+    "          <div class=\"metric-card\">\n"
+    "            <span>{label}</span>\n"
+    "            <strong>{value}</strong>\n"
+    "            <div class=\"item-meta\">{note}</div>\n"
+    "          </div>"
+)
+_EXPERIMENT_TMPL = (
+    "          <li class=\"experiment-item\">\n"
+    "            <div>\n"
+    "              <strong>{title}</strong>\n"
+    "              <div class=\"item-meta\">{detail}</div>\n"
+    "            </div>\n"
+    "            <div class=\"item-meta\">Owner: {owner}</div>\n"
+    "          </li>"
+)
+
+
+def _read(path: Path) -> str:
+    text = path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        # Match read_text's universal newline handling for files saved with CRLF.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write(path: Path, text: str) -> None:
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write fewer bytes than requested; loop until done.
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
+@lru_cache(maxsize=4096)
 def _parse_iso(ts: str) -> datetime | None:
     if not ts:
         return None
@@ -27,17 +130,47 @@ def _parse_iso(ts: str) -> datetime | None:
     return None
 
 
+@lru_cache(maxsize=4096)
+def _format_time(ts: str) -> str:
+    parsed = _parse_iso(ts)
+    if not parsed:
+        return ts
+    # Common "YYYY-MM-DDTHH:MM[:SS[.fff]][tz]" shape: slice instead of strftime.
+    match = _ISO_DISPLAY_RE.fullmatch(ts)
+    if not match:
+        return parsed.strftime("%Y-%m-%d %H:%M %z").strip()
+    date, clock, tz = match.groups()
+    if tz is None:
+        return f"{date} {clock}"
+    offset = tz.replace(":", "")
+    if tz == "Z" or offset[1:] == "0000":
+        offset = "+0000"
+    return f"{date} {clock} {offset}"
+
+
 def _strip_tags(value: str) -> str:
-    return re.sub(r"<[^>]+>", "", value).strip()
+    if "<" not in value:
+        return value.strip()
+    return _TAG_RE.sub("", value).strip()
 
 
 def _indent_block(text: str, spaces: int) -> str:
-    pad = " " * spaces
-    return "\n".join(pad + line if line.strip() else line for line in text.splitlines())
+    return _INDENT_NONBLANK_RE.sub(" " * spaces, text)
+
+
+def _render(pattern: re.Pattern[str], template: str, mapping: dict[str, str]) -> str:
+    return pattern.sub(lambda m: mapping[m.group(1)], template)
+
+
+def _escape(value: str) -> str:
+    # Most fields are plain text; skip escape's chain of replace passes for them.
+    if "&" in value or "<" in value or ">" in value or '"' in value or "'" in value:
+        return escape(value)
+    return value
 
 
 def _extract_section(html: str) -> str:
-    match = re.search(r"(<section[^>]*>.*?</section>)", html, re.S)
+    match = _SECTION_RE.search(html)
     if match:
         return match.group(1).strip()
     return html.strip()
@@ -49,31 +182,52 @@ def _repo_page_filename(repo: str) -> str:
     return f"repo-{repo}.html"
 
 
+@lru_cache(maxsize=None)
+def _badge_label(repo: str) -> str:
+    parts = [part for part in _SLUG_SPLIT_RE.split(repo) if part]
+    if not parts:
+        return "RP"
+    if len(parts) == 1:
+        token = parts[0][:2]
+    else:
+        token = "".join(part[0] for part in parts[:2])
+    return token.upper()
+
+
+def _mark_active(rail_entry: str) -> str:
+    return rail_entry.replace("server-dot", "server-dot active", 1)
+
+
+def _repo_output_path(page: str) -> Path:
+    return ROOT / "private" / "dev" / page
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
 def _extract_articles(section_html: str) -> list[dict]:
     articles = []
-    for status, time_raw, body in re.findall(
-        r'<article[^>]*data-status="([^"]+)"[^>]*data-time="([^"]+)"[^>]*>(.*?)</article>',
-        section_html,
-        re.S,
-    ):
-        summary = ""
-        stage = ""
-        notes = ""
-        h4_match = re.search(r"<h4>(.*?)</h4>", body, re.S)
-        if h4_match:
-            summary = _strip_tags(unescape(h4_match.group(1)))
-        stage_match = re.search(r"<strong>Stage:</strong>\s*([^<]+)", body, re.S)
-        if stage_match:
-            stage = _strip_tags(unescape(stage_match.group(1)))
-        notes_match = re.search(r"<strong>Notes:</strong>\s*([^<]+)", body, re.S)
-        if notes_match:
-            notes = _strip_tags(unescape(notes_match.group(1)))
+    for status, time_raw, body in _ARTICLE_RE.findall(section_html):
+        fields = {}
+        for match in _BODY_RE.finditer(body):
+            if match.group(1) is not None:
+                key, value = "summary", match.group(1)
+            else:
+                key, value = match.group(2).lower(), match.group(3)
+            if key not in fields:
+                fields[key] = _strip_tags(unescape(value) if "&" in value else value)
+                if len(fields) == 3:
+                    break
+        summary = fields.get("summary", "")
+        stage = fields.get("stage", "")
+        notes = fields.get("notes", "")
 
         parsed_time = _parse_iso(time_raw)
-        if parsed_time:
-            time_display = parsed_time.strftime("%Y-%m-%d %H:%M %z").strip()
-        else:
-            time_display = time_raw
+        time_display = _format_time(time_raw)
 
         articles.append(
             {
@@ -83,22 +237,43 @@ def _extract_articles(section_html: str) -> list[dict]:
                 "summary": summary,
                 "stage": stage,
                 "notes": notes,
+                "summary_e": _escape(summary),
+                "stage_e": _escape(stage),
+                "notes_e": _escape(notes),
                 "sort_key": parsed_time or datetime.min,
             }
         )
     return articles
 
 
-def _parse_update_file(path: Path) -> dict:
-    raw = path.read_text(encoding="utf-8")
+def _list_updates() -> list[tuple[Path, float]]:
+    # One directory pass yields both the update files and their mtimes. Only a
+    # missing directory means "no updates"; a bad entry still raises.
+    try:
+        it = os.scandir(UPDATES_DIR)
+    except FileNotFoundError:
+        return []
+    with it:
+        entries = [
+            (Path(entry.path), entry.stat().st_mtime)
+            for entry in it
+            if entry.name.startswith("updates-") and entry.name.endswith(".html")
+        ]
+    entries.sort()
+    return entries
+
+
+def _parse_update_file(path: Path, mtime: float) -> dict:
+    raw = _read(path)
     section_html = _extract_section(raw)
 
-    section_match = re.search(
-        r'<section[^>]*data-repo="([^"]+)"[^>]*data-agent="([^"]+)"',
-        section_html,
-    )
+    section_match = _SECTION_ATTRS_RE.search(section_html)
     repo = section_match.group(1) if section_match else path.stem.replace("updates-", "")
     agent = section_match.group(2) if section_match else "unknown"
+    if section_match:
+        # Attribute values are HTML-encoded; decode them so they are escaped once.
+        repo = unescape(repo) if "&" in repo else repo
+        agent = unescape(agent) if "&" in agent else agent
 
     articles = _extract_articles(section_html)
     latest = articles[0] if articles else {}
@@ -108,31 +283,195 @@ def _parse_update_file(path: Path) -> dict:
     parsed_time = latest.get("sort_key")
     time_display = latest.get("time_display", time_raw)
 
+    page = _repo_page_filename(repo)
     return {
         "repo": repo,
+        "repo_e": _escape(repo),
+        "badge": _badge_label(repo),
+        "page": page,
+        "page_e": _escape(page),
         "agent": agent,
+        "agent_e": _escape(agent),
         "status": status or "unknown",
+        "status_label": (status or "unknown").capitalize(),
         "time_raw": time_raw,
         "time_display": time_display,
         "summary": summary,
+        "summary_e": latest.get("summary_e", ""),
         "section_html": section_html,
         "sort_key": parsed_time or datetime.min,
         "articles": articles,
+        "source_mtime": mtime,
     }
 
 
-def build_dashboard() -> None:
-    update_files = sorted(UPDATES_DIR.glob("updates-*.html"))
-    updates = [_parse_update_file(path) for path in update_files]
-    updates.sort(key=lambda item: item["sort_key"], reverse=True)
+def _render_repo_page(item: dict, repo_template: str, repo_server_rail: str) -> None:
+    articles = item.get("articles", [])
+    latest = articles[0] if articles else {}
+    latest_status = latest.get("status", "unknown")
+    latest_status_label = latest_status.capitalize()
+    latest_summary = latest.get("summary_e", "No updates yet")
+    latest_stage = latest.get("stage_e", "update")
+    latest_time = latest.get("time_display", "-")
+    incidents = []
+    completed = 0
+    for article in articles:
+        article_status = article.get("status")
+        if article_status == "error":
+            incidents.append(article)
+        elif article_status == "complete":
+            completed += 1
+    errors = len(incidents)
+    recent_incident = incidents[0] if incidents else None
+    recent_outcome_title = (
+        recent_incident.get("summary_e") if recent_incident else "No incidents"
+    )
+    recent_outcome_note = (
+        recent_incident.get("notes_e")
+        if recent_incident and recent_incident.get("notes_e")
+        else "Latest activity looks healthy."
+    )
+
+    activity_items = [
+        _ACTIVITY_TMPL.format_map(
+            {
+                "summary": activity.get("summary_e") or "Update",
+                "stage": activity.get("stage_e") or "update",
+                "time": activity.get("time_display") or "-",
+            }
+        )
+        for activity in articles[:3]
+    ]
+    if not activity_items:
+        activity_items.append(
+            "          <li class=\"activity-item\">\n"
+            "            <div>\n"
+            "              <strong>No activity recorded yet</strong>\n"
+            "              <div class=\"item-meta\">Add updates to populate this feed.</div>\n"
+            "            </div>\n"
+            "            <div class=\"item-meta\">-</div>\n"
+            "          </li>"
+        )
 
-    rows = []
-    history_blocks = []
-    server_rail = [
-        "      <a class=\"server-dot active\" href=\"dashboard.html\" title=\"Dashboard\">CD</a>"
+    incident_items = [
+        _INCIDENT_TMPL.format_map(
+            {
+                "summary": incident.get("summary_e") or "Incident",
+                "notes": incident.get("notes_e") or "Details in update log.",
+                "time": incident.get("time_display") or "-",
+            }
+        )
+        for incident in incidents
     ]
+    if not incident_items:
+        incident_items.append(
+            "          <li class=\"incident-item\">\n"
+            "            <div>\n"
+            "              <strong>No incidents reported</strong>\n"
+            "              <div class=\"item-meta\">All clear in recent updates.</div>\n"
+            "            </div>\n"
+            "            <div class=\"item-meta\">-</div>\n"
+            "          </li>"
+        )
+
+    total = completed + errors
+    success_rate = f"{round((completed / total) * 100)}%" if total else "N/A"
 
-    repo_template = REPO_TEMPLATE_PATH.read_text(encoding="utf-8")
+    metric_cards = "\n".join(
+        _METRIC_TMPL.format_map({"label": label, "value": value, "note": note})
+        for label, value, note in (
+            ("Success rate", success_rate, "Recent updates"),
+            ("Total updates", len(articles), "Logged entries"),
+            ("Open incidents", errors, "Error entries"),
+            ("Last update", latest_time or "-", "Most recent entry"),
+        )
+    )
+
+    experiment_items = "\n".join(
+        (
+            _EXPERIMENT_TMPL.format_map(
+                {
+                    "title": "Experiment backlog",
+                    "detail": "Status: pending · Capture experiments in updates.",
+                    "owner": item["agent_e"],
+                }
+            ),
+            _EXPERIMENT_TMPL.format_map(
+                {
+                    "title": "Automation improvements",
+                    "detail": "Status: planning · Track automation tweaks.",
+                    "owner": "engineering",
+                }
+            ),
+        )
+    )
+
+    repo_page = _render(
+        _REPO_RE,
+        repo_template,
+        {
+            "SERVER_RAIL": repo_server_rail,
+            "REPO_NAME": item["repo_e"],
+            "AGENT_NAME": item["agent_e"],
+            "LATEST_STATUS_CLASS": latest_status,
+            "LATEST_STATUS_LABEL": latest_status_label,
+            "LATEST_SUMMARY": latest_summary or "Update",
+            "LATEST_STAGE": latest_stage or "update",
+            "LATEST_TIME_DISPLAY": latest_time or "-",
+            "RECENT_OUTCOME_TITLE": recent_outcome_title or "No incidents",
+            "RECENT_OUTCOME_NOTE": recent_outcome_note or "",
+            "ACTIVITY_ITEMS": "\n".join(activity_items),
+            "INCIDENT_ITEMS": "\n".join(incident_items),
+            "METRIC_CARDS": metric_cards,
+            "EXPERIMENT_ITEMS": experiment_items,
+            "HISTORY_SECTION": _indent_block(item["section_html"], 8),
+        },
+    )
+
+    repo_output = _repo_output_path(item["page"])
+    _write(repo_output, repo_page)
+
+
+def _previous_rail(template: str) -> str | None:
+    """Return the rail embedded in the current dashboard.html, if recoverable."""
+    before, found, rest = template.partition("{{SERVER_RAIL}}")
+    if not found or _DASH_RE.search(before):
+        return None
+    # The fixed text up to the next placeholder marks where the rail ends.
+    after = _DASH_RE.split(rest, maxsplit=1)[0]
+    previous = _read(OUTPUT_PATH)
+    if not after or not previous.startswith(before):
+        return None
+    end = previous.find(after, len(before))
+    if end < 0:
+        return None
+    return previous[len(before):end]
+
+
+def build_dashboard(force: bool = False) -> None:
+    update_files = _list_updates()
+
+    # Outputs older than the script or a template are stale regardless of the
+    # update files. The updates directory mtime catches deleted update files.
+    script_mtime = _mtime(Path(__file__))
+    repo_inputs_mtime = max(script_mtime, _mtime(REPO_TEMPLATE_PATH))
+    dashboard_mtime = _mtime(OUTPUT_PATH)
+    dashboard_inputs_mtime = max(
+        repo_inputs_mtime,
+        _mtime(TEMPLATE_PATH),
+        _mtime(UPDATES_DIR),
+        *(mtime for _, mtime in update_files),
+    )
+    dashboard_fresh = (
+        not force and dashboard_mtime > 0 and dashboard_mtime >= dashboard_inputs_mtime
+    )
+
+    updates = [_parse_update_file(path, mtime) for path, mtime in update_files]
+    updates.sort(key=lambda item: item["sort_key"], reverse=True)
+
+    rows: list[str] = []
+    history_blocks: list[str] = []
+    server_rail = [_mark_active(DASHBOARD_RAIL_ENTRY)]
 
     if not updates:
         rows.append(
@@ -145,189 +484,81 @@ def build_dashboard() -> None:
             "</tr>"
         )
     else:
-        def badge_label(repo: str) -> str:
-            parts = [part for part in re.split(r"[^A-Za-z0-9]+", repo) if part]
-            if not parts:
-                return "RP"
-            if len(parts) == 1:
-                token = parts[0][:2]
-            else:
-                token = "".join(part[0] for part in parts[:2])
-            return token.upper()
-
+        rail_entries: dict[str, str] = {}
         for item in updates:
-            server_rail.append(
-                f"      <a class=\"server-dot\" href=\"{_repo_page_filename(item['repo'])}\" title=\"{item['repo']}\">{badge_label(item['repo'])}</a>"
-            )
-            status_label = item["status"].capitalize()
-            repo_slug = item["repo"]
-            rows.append(
-                "            <tr>\n"
-                f"              <td data-label=\"Repo\"><a class=\"repo-link\" href=\"{_repo_page_filename(repo_slug)}\">{repo_slug}</a></td>\n"
-                f"              <td data-label=\"Latest Status\"><span class=\"status-pill {item['status']}\">{status_label}</span></td>\n"
-                f"              <td data-label=\"Last Update\">{item['time_display']}</td>\n"
-                f"              <td data-label=\"Agent\">{item['agent']}</td>\n"
-                f"              <td data-label=\"Summary\">{item['summary']}</td>\n"
-                "            </tr>"
-            )
-
-            history_blocks.append(
-                "          <div class=\"repo-block\">\n"
-                "            <div class=\"repo-header\">\n"
-                f"              <h3>{item['repo']}</h3>\n"
-                f"              <span>Agent: {item['agent']}</span>\n"
-                "            </div>\n"
-                f"{_indent_block(item['section_html'], 12)}\n"
-                "          </div>"
-            )
-
-            articles = item.get("articles", [])
-            latest = articles[0] if articles else {}
-            latest_status = latest.get("status", "unknown")
-            latest_status_label = latest_status.capitalize()
-            latest_summary = latest.get("summary", "No updates yet")
-            latest_stage = latest.get("stage", "update")
-            latest_time = latest.get("time_display", "-")
-            recent_incident = next((a for a in articles if a.get("status") == "error"), None)
-            recent_outcome_title = (
-                recent_incident.get("summary") if recent_incident else "No incidents"
-            )
-            recent_outcome_note = (
-                recent_incident.get("notes")
-                if recent_incident and recent_incident.get("notes")
-                else "Latest activity looks healthy."
-            )
-
-            activity_items = []
-            for activity in articles[:3]:
-                activity_items.append(
-                    "          <li class=\"activity-item\">\n"
-                    "            <div>\n"
-                    f"              <strong>{activity.get('summary') or 'Update'}</strong>\n"
-                    f"              <div class=\"item-meta\">Stage: {activity.get('stage') or 'update'}</div>\n"
-                    "            </div>\n"
-                    f"            <div class=\"item-meta\">{activity.get('time_display') or '-'}</div>\n"
-                    "          </li>"
-                )
-            if not activity_items:
-                activity_items.append(
-                    "          <li class=\"activity-item\">\n"
-                    "            <div>\n"
-                    "              <strong>No activity recorded yet</strong>\n"
-                    "              <div class=\"item-meta\">Add updates to populate this feed.</div>\n"
-                    "            </div>\n"
-                    "            <div class=\"item-meta\">-</div>\n"
-                    "          </li>"
-                )
-
-            incident_items = []
-            for incident in [a for a in articles if a.get("status") == "error"]:
-                incident_items.append(
-                    "          <li class=\"incident-item\">\n"
-                    "            <div>\n"
-                    f"              <strong>{incident.get('summary') or 'Incident'}</strong>\n"
-                    f"              <div class=\"item-meta\">{incident.get('notes') or 'Details in update log.'}</div>\n"
-                    "            </div>\n"
-                    f"            <div class=\"item-meta\">{incident.get('time_display') or '-'}</div>\n"
-                    "          </li>"
-                )
-            if not incident_items:
-                incident_items.append(
-                    "          <li class=\"incident-item\">\n"
-                    "            <div>\n"
-                    "              <strong>No incidents reported</strong>\n"
-                    "              <div class=\"item-meta\">All clear in recent updates.</div>\n"
-                    "            </div>\n"
-                    "            <div class=\"item-meta\">-</div>\n"
-                    "          </li>"
-                )
-
-            completed = len([a for a in articles if a.get("status") == "complete"])
-            errors = len([a for a in articles if a.get("status") == "error"])
-            total = completed + errors
-            success_rate = f"{round((completed / total) * 100)}%" if total else "N/A"
-
-            metric_cards = "\n".join(
-                [
-                    "          <div class=\"metric-card\">\n"
-                    "            <span>Success rate</span>\n"
-                    f"            <strong>{success_rate}</strong>\n"
-                    "            <div class=\"item-meta\">Recent updates</div>\n"
-                    "          </div>",
-                    "          <div class=\"metric-card\">\n"
-                    "            <span>Total updates</span>\n"
-                    f"            <strong>{len(articles)}</strong>\n"
-                    "            <div class=\"item-meta\">Logged entries</div>\n"
-                    "          </div>",
-                    "          <div class=\"metric-card\">\n"
-                    "            <span>Open incidents</span>\n"
-                    f"            <strong>{errors}</strong>\n"
-                    "            <div class=\"item-meta\">Error entries</div>\n"
-                    "          </div>",
-                    "          <div class=\"metric-card\">\n"
-                    "            <span>Last update</span>\n"
-                    f"            <strong>{latest_time or '-'}</strong>\n"
-                    "            <div class=\"item-meta\">Most recent entry</div>\n"
-                    "          </div>",
-                ]
-            )
+            entry = _RAIL_TMPL.format_map(item)
+            rail_entries[item["repo"]] = entry
+            server_rail.append(entry)
+        # Repo pages share the dashboard rail; only the "active" marker moves.
+        base_rail = "\n".join([DASHBOARD_RAIL_ENTRY, *server_rail[1:]])
+
+        # Every repo page embeds the rail, so a page is only reusable while the
+        # rail it was rendered with matches the one the dashboard last shipped.
+        rail_unchanged = (
+            not force
+            and dashboard_mtime > 0
+            and _previous_rail(_read(TEMPLATE_PATH)) == "\n".join(server_rail)
+        )
 
-            experiment_items = "\n".join(
-                [
-                    "          <li class=\"experiment-item\">\n"
-                    "            <div>\n"
-                    "              <strong>Experiment backlog</strong>\n"
-                    "              <div class=\"item-meta\">Status: pending · Capture experiments in updates.</div>\n"
-                    "            </div>\n"
-                    f"            <div class=\"item-meta\">Owner: {item['agent']}</div>\n"
-                    "          </li>",
-                    "          <li class=\"experiment-item\">\n"
-                    "            <div>\n"
-                    "              <strong>Automation improvements</strong>\n"
-                    "              <div class=\"item-meta\">Status: planning · Track automation tweaks.</div>\n"
-                    "            </div>\n"
-                    "            <div class=\"item-meta\">Owner: engineering</div>\n"
-                    "          </li>",
-                ]
-            )
+        # Two repos can share a page file ("alpha" and "repo-alpha"); only the
+        # one written last by a sequential loop is rendered, so threads never
+        # write the same file.
+        page_owners = {item["page"]: item for item in updates}
 
-            repo_server_rail = [
-                "      <a class=\"server-dot\" href=\"dashboard.html\" title=\"Dashboard\">CD</a>"
-            ]
-            for rail_item in updates:
-                active = " active" if rail_item["repo"] == item["repo"] else ""
-                repo_server_rail.append(
-                    f"      <a class=\"server-dot{active}\" href=\"{_repo_page_filename(rail_item['repo'])}\" title=\"{rail_item['repo']}\">{badge_label(rail_item['repo'])}</a>"
+        stale: list[dict] = []
+        repo_rails: list[str] = []
+        for item in updates:
+            rows.append(_ROW_TMPL.format_map(item))
+            history_blocks.append(
+                _HISTORY_TMPL.format(
+                    repo=item["repo_e"],
+                    agent=item["agent_e"],
+                    section=_indent_block(item["section_html"], 12),
                 )
-
-            repo_page = repo_template
-            repo_page = repo_page.replace("{{SERVER_RAIL}}", "\n".join(repo_server_rail))
-            repo_page = repo_page.replace("{{REPO_NAME}}", item["repo"])
-            repo_page = repo_page.replace("{{AGENT_NAME}}", item["agent"])
-            repo_page = repo_page.replace("{{LATEST_STATUS_CLASS}}", latest_status)
-            repo_page = repo_page.replace("{{LATEST_STATUS_LABEL}}", latest_status_label)
-            repo_page = repo_page.replace("{{LATEST_SUMMARY}}", latest_summary or "Update")
-            repo_page = repo_page.replace("{{LATEST_STAGE}}", latest_stage or "update")
-            repo_page = repo_page.replace("{{LATEST_TIME_DISPLAY}}", latest_time or "-")
-            repo_page = repo_page.replace("{{RECENT_OUTCOME_TITLE}}", recent_outcome_title or "No incidents")
-            repo_page = repo_page.replace("{{RECENT_OUTCOME_NOTE}}", recent_outcome_note or "")
-            repo_page = repo_page.replace("{{ACTIVITY_ITEMS}}", "\n".join(activity_items))
-            repo_page = repo_page.replace("{{INCIDENT_ITEMS}}", "\n".join(incident_items))
-            repo_page = repo_page.replace("{{METRIC_CARDS}}", metric_cards)
-            repo_page = repo_page.replace("{{EXPERIMENT_ITEMS}}", experiment_items)
-            repo_page = repo_page.replace(
-                "{{HISTORY_SECTION}}", _indent_block(item["section_html"], 8)
             )
 
-            repo_output = ROOT / "private" / "dev" / _repo_page_filename(item["repo"])
-            repo_output.write_text(repo_page, encoding="utf-8")
-
-    template = TEMPLATE_PATH.read_text(encoding="utf-8")
-    rendered = template.replace("{{STATUS_ROWS}}", "\n".join(rows))
-    rendered = rendered.replace("{{HISTORY_BLOCKS}}", "\n".join(history_blocks))
-    rendered = rendered.replace("{{SERVER_RAIL}}", "\n".join(server_rail))
-    OUTPUT_PATH.write_text(rendered, encoding="utf-8")
+            if page_owners[item["page"]] is not item:
+                continue
+            if rail_unchanged and _mtime(_repo_output_path(item["page"])) >= max(
+                item["source_mtime"], repo_inputs_mtime
+            ):
+                continue
+            stale.append(item)
+            own_entry = rail_entries[item["repo"]]
+            repo_rails.append(base_rail.replace(own_entry, _mark_active(own_entry)))
+
+        # A fresh dashboard alone is not enough: a repo page may have been
+        # deleted or be older than its inputs.
+        if dashboard_fresh and not stale:
+            return
+
+        # Repo pages are independent of each other, so render them concurrently.
+        if stale:
+            repo_template = _read(REPO_TEMPLATE_PATH)
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(_render_repo_page, stale, repeat(repo_template), repo_rails))
+
+    if dashboard_fresh:
+        return
+
+    template = _read(TEMPLATE_PATH)
+    rendered = _render(
+        _DASH_RE,
+        template,
+        {
+            "STATUS_ROWS": "\n".join(rows),
+            "HISTORY_BLOCKS": "\n".join(history_blocks),
+            "SERVER_RAIL": "\n".join(server_rail),
+        },
+    )
+    _write(OUTPUT_PATH, rendered)
 
 
 if __name__ == "__main__":
-    build_dashboard()
+    parser = argparse.ArgumentParser(description="Rebuild the dev dashboard pages.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="re-render every page even if its output looks newer than its inputs",
+    )
+    build_dashboard(force=parser.parse_args().force)